@@ -1,193 +1,381 @@
 #include <stdio.h>
+#include <stdlib.h>
 #include <string.h>
 
-#define FILENAME_SIZE 1024
-#define MAX_LINE 2048
-int num = 0;
+#define DIRECTORY_FILE "telephone_directory.txt"
+#define HEADER_LINE "NAME                    NUMBER\n"
+#define NAME_WIDTH 20
+#define NUMBER_WIDTH 10
 
 struct telephone
 {
-    char name[20];
-    char number[11];
+    char name[NAME_WIDTH];
+    char number[NUMBER_WIDTH + 1];
 };
 
-// Function to insert spaces in the file
-void space(int len, FILE *file)
+struct telephone *entries = NULL;
+int num = 0;
+int capacity = 0;
+
+// Function to grow the in-memory entries table on demand
+int ensureCapacity(int needed)
 {
-    char c = ' ';
-    
-    for (int i = 0; i < len; i++)
+    if (needed <= capacity)
+    {
+        return 1;
+    }
+
+    int new_capacity = (capacity == 0) ? 16 : capacity * 2;
+    while (new_capacity < needed)
+    {
+        new_capacity *= 2;
+    }
+
+    struct telephone *grown = realloc(entries, new_capacity * sizeof(struct telephone));
+    if (grown == NULL)
+    {
+        return 0;
+    }
+
+    entries = grown;
+    capacity = new_capacity;
+    return 1;
+}
+
+// Function to load the existing entries from the file into memory
+void loadDirectory(FILE *file)
+{
+    fseek(file, 0, SEEK_END);
+    long size = ftell(file);
+    rewind(file);
+
+    if (size <= 0)
+    {
+        return;
+    }
+
+    // Read the whole file in one go and parse the records from memory
+    char *buffer = malloc(size + 1);
+    if (buffer == NULL)
+    {
+        fputs("Unable to load the directory.", stdout);
+        return;
+    }
+
+    long length = fread(buffer, 1, size, file);
+    buffer[length] = '\0';
+
+    // Skip the header line
+    char *line = strchr(buffer, '\n');
+
+    while (line != NULL)
+    {
+        line++;
+        char *end = strchr(line, '\n');
+        long line_len = (end != NULL) ? end - line : (long)strlen(line);
+
+        if (line_len > NAME_WIDTH)
+        {
+            if (!ensureCapacity(num + 1))
+            {
+                break;
+            }
+
+            strncpy(entries[num].number, line + NAME_WIDTH, NUMBER_WIDTH);
+            entries[num].number[NUMBER_WIDTH] = '\0';
+            char *newline = strchr(entries[num].number, '\n');
+            if (newline != NULL)
+            {
+                *newline = '\0';
+            }
+
+            int name_len = NAME_WIDTH - 1;
+            while (name_len > 0 && line[name_len - 1] == ' ')
+            {
+                name_len--;
+            }
+
+            strncpy(entries[num].name, line, name_len);
+            entries[num].name[name_len] = '\0';
+
+            num++;
+        }
+
+        line = end;
+    }
+
+    free(buffer);
+}
+
+int loaded = 0;
+int dirty = 0;
+
+// Function to load the directory on first use
+void ensureLoaded()
+{
+    if (loaded)
     {
-        fprintf(file, "%c", c);
+        return;
+    }
+
+    loaded = 1;
+
+    FILE *file = fopen(DIRECTORY_FILE, "r");
+    if (file == NULL)
+    {
+        return;
     }
+
+    loadDirectory(file);
+    fclose(file);
+}
+
+// Function to format a telephone entry as one directory record
+int formatRecord(struct telephone* input, char *record)
+{
+    return snprintf(record, NAME_WIDTH + NUMBER_WIDTH + 2, "%-*s%s\n", NAME_WIDTH, input->name, input->number);
 }
 
 // Function to write a telephone entry to the file
 void write(struct telephone* input, FILE *file)
 {
-    int len = strlen(input->name);
-    int sp_len = 20 - len;
-    
-    fprintf(file, "%s", input->name);
-    space(sp_len, file);
-    fprintf(file, "%s\n", input->number);
+    char record[NAME_WIDTH + NUMBER_WIDTH + 2];
+    int len = formatRecord(input, record);
+
+    fwrite(record, 1, len, file);
+}
+
+// Function to check that a phone number is non-empty and all digits
+int validNumber(const char *number)
+{
+    if (number[0] == '\0')
+    {
+        return 0;
+    }
+
+    for (int i = 0; number[i] != '\0'; i++)
+    {
+        if (number[i] < '0' || number[i] > '9')
+        {
+            return 0;
+        }
+    }
+
+    return 1;
 }
 
 // Function to insert a new entry in the telephone directory
-void insertEntry(FILE *file)
+void insertEntry()
 {
-    static int number = 1;
-    printf("Entry number %d: \n",number);
-    
-    fseek(file, 0, SEEK_END);
-    struct telephone newentry;
-    
-    printf("Enter the Name: ");
-    scanf(" %[^\n]s", newentry.name);
-    
-    printf("Enter the phoneNumber: ");
-    scanf(" %[^\n]s", newentry.number);
-    
-    write(&newentry, file);
-    printf("Entry inserted...\n");
-    number+=1;
+    if (!ensureCapacity(num + 1))
+    {
+        puts("The directory is full.");
+        return;
+    }
+
+    printf("Entry number %d: \n",num + 1);
+
+    struct telephone *newentry = &entries[num];
+
+    fputs("Enter the Name: ", stdout);
+    scanf(" %19[^\n]", newentry->name);
+
+    char number[NUMBER_WIDTH + 1];
+    fputs("Enter the phoneNumber: ", stdout);
+    scanf(" %10[^\n]", number);
+
+    if (!validNumber(number))
+    {
+        puts("Invalid phone number.");
+        return;
+    }
+
+    strcpy(newentry->number, number);
+
+    num++;
+    dirty = 1;
+    puts("Entry inserted...");
 }
 
 // Function to update an existing entry in the telephone directory
-void updateEntry(FILE *file)
+void updateEntry()
 {
     if (num > 0)
     {
-        printf("Give the entry number n-%d...\n",num - 1);
+        printf("Give the entry number 1-%d...\n",num);
     }
-    
+
     int entrynumber;
-    printf("Enter the entry number to update: ");
+    fputs("Enter the entry number to update: ", stdout);
     scanf("%d", &entrynumber);
-    entrynumber += 1;
-    fflush(stdin);
-    
-    fseek(file, (entrynumber - 1) * sizeof(struct telephone), SEEK_SET);
-    
-    struct telephone existingEntry;
-    fread(&existingEntry, sizeof(struct telephone), 1, file);
-    
-    printf("Enter Updated name: ");
-    scanf(" %[^\n]s", existingEntry.name);
 
-    printf("Enter updated phoneNumber: ");
-    scanf(" %[^\n]s", existingEntry.number);
-    
-    fseek(file, (entrynumber - 1) * sizeof(struct telephone), SEEK_SET);
-    
-    write(&existingEntry, file);
-    printf("Updated successfully...\n");
-}
+    if (entrynumber < 1 || entrynumber > num)
+    {
+        puts("Invalid entry number.");
+        return;
+    }
 
-// Function to remove a specific line from the file
-void RemoveLineFromFile(FILE *file, int line_number)
-{
-    FILE *temp_file = fopen("temp.txt", "w");
-    if (temp_file == NULL)
+    struct telephone *existingEntry = &entries[entrynumber - 1];
+
+    char name[NAME_WIDTH];
+    fputs("Enter Updated name: ", stdout);
+    scanf(" %19[^\n]", name);
+
+    char number[NUMBER_WIDTH + 1];
+    fputs("Enter updated phoneNumber: ", stdout);
+    scanf(" %10[^\n]", number);
+
+    if (!validNumber(number))
     {
-        printf("Unable to open the temporary file.");
+        puts("Invalid phone number.");
         return;
     }
-    
-    char buffer[MAX_LINE];
-    int current_line = 1;
-    
-    while (fgets(buffer, MAX_LINE, file) != NULL)
+
+    strcpy(existingEntry->name, name);
+    strcpy(existingEntry->number, number);
+
+    dirty = 1;
+    puts("Updated successfully...");
+}
+
+// Function to rewrite the directory file from the in-memory entries
+void saveDirectory(FILE *file)
+{
+    // Build the whole file image in one buffer and write it in one call
+    char *buffer = malloc(strlen(HEADER_LINE) + (size_t)num * (NAME_WIDTH + NUMBER_WIDTH + 2));
+
+    if (buffer == NULL)
     {
-        if (current_line != line_number)
+        // Fall back to writing one record at a time
+        fputs(HEADER_LINE, file);
+
+        for (int i = 0; i < num; i++)
         {
-            fputs(buffer, temp_file);
+            write(&entries[i], file);
         }
-        
-        current_line++;
+
+        return;
     }
-    
+
+    int length = strlen(HEADER_LINE);
+    memcpy(buffer, HEADER_LINE, length);
+
+    for (int i = 0; i < num; i++)
+    {
+        length += formatRecord(&entries[i], buffer + length);
+    }
+
+    fwrite(buffer, 1, length, file);
+    free(buffer);
+}
+
+// Function to write the pending in-memory changes back to the file
+void flushDirectory()
+{
+    FILE *file = fopen(DIRECTORY_FILE, "w");
+    if (file == NULL)
+    {
+        fputs("Unable to open the file.", stdout);
+        return;
+    }
+
+    saveDirectory(file);
     fclose(file);
-    fclose(temp_file);
-    
-    remove("telephone_directory.txt");
-    rename("temp.txt", "telephone_directory.txt");
-    
-    printf("Entry deleted successfully.\n");
+
+    dirty = 0;
 }
 
 // Function to delete an entry from the telephone directory
 void deleteEntry()
 {
     int entrynumber;
-    
+
     if (num > 0)
     {
-        printf("Give the entry number n-%d...\n",num);
+        printf("Give the entry number 1-%d...\n",num);
     }
-    
-    printf("Enter entry number to delete: ");
+
+    fputs("Enter entry number to delete: ", stdout);
     scanf("%d", &entrynumber);
-    entrynumber += 1;
-    fflush(stdin);
-    
-    FILE *file = fopen("telephone_directory.txt", "r");
-    if (file == NULL)
+
+    if (entrynumber < 1 || entrynumber > num)
     {
-        printf("Unable to open the file.");
+        puts("Invalid entry number.");
         return;
     }
-    
-    RemoveLineFromFile(file, entrynumber);
-    
-    num++;
+
+    for (int i = entrynumber - 1; i < num - 1; i++)
+    {
+        entries[i] = entries[i + 1];
+    }
+
+    num--;
+    dirty = 1;
+
+    puts("Entry deleted successfully.");
 }
 
-int main()
+// Function to display all entries in the telephone directory
+void viewEntries()
 {
-    FILE *file = fopen("telephone_directory.txt", "wb+");
-    
-    if (file == NULL)
+    if (num == 0)
     {
-        printf("Unable to create the file.");
-        return 1;
+        puts("The directory is empty.");
+        return;
     }
-    
-    fprintf(file, "NAME                    NUMBER\n");
-    
+
+    fputs(HEADER_LINE, stdout);
+
+    for (int i = 0; i < num; i++)
+    {
+        printf("%-*s%s\n", NAME_WIDTH, entries[i].name, entries[i].number);
+    }
+}
+
+int main()
+{
     int choice;
     
     while (1)
     {
-        printf("Telephone Directory Menu:\n");
-        printf("1. Insert an entry\n");
-        printf("2. Update an entry\n");
-        printf("3. Delete an entry\n");
-        printf("4. Exit\n");
-        printf("Enter your choice: ");
+        puts("Telephone Directory Menu:");
+        puts("1. Insert an entry");
+        puts("2. Update an entry");
+        puts("3. Delete an entry");
+        puts("4. View all entries");
+        puts("5. Exit");
+        fputs("Enter your choice: ", stdout);
         scanf("%d", &choice);
         
         switch (choice)
         {
             case 1:
-                insertEntry(file);
+                ensureLoaded();
+                insertEntry();
                 break;
             case 2:
-                updateEntry(file);
+                ensureLoaded();
+                updateEntry();
                 break;
             case 3:
-                fclose(file);
+                ensureLoaded();
                 deleteEntry();
-                file = fopen("telephone_directory.txt","r+");
                 break;
             case 4:
-                fclose(file);
-                printf("Exiting...\n");
+                ensureLoaded();
+                viewEntries();
+                break;
+            case 5:
+                if (dirty)
+                {
+                    flushDirectory();
+                }
+                puts("Exiting...");
                 return 0;
             default:
-                printf("Invalid operation.\n");
+                puts("Invalid operation.");
         }
         
-        printf("\n");
+        puts("");
     }
 }